@@ -1,21 +1,74 @@
 #!/usr/bin/env python3
 import subprocess
+import copy
 import datetime
+import functools
+import glob
 import os
 import multiprocessing
 import json
-from typing import Dict, List, Optional, Tuple
+import mmap
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import shutil
+import shlex
 import sys
 import logging
 from enum import Enum
 import yaml
 from pathlib import Path
+import distro
 import platform
+import re
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import tarfile
 import tempfile
-from dataclasses import dataclass
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+
+try:
+    import orjson
+except ImportError:  # optional, only speeds up JSON encoding/decoding
+    orjson = None
+
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as YamlLoader
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11, TOML configs unavailable
+    tomllib = None
+
+
+# Host properties that cannot change during a run
+CPU_COUNT = multiprocessing.cpu_count()
+
+
+@functools.lru_cache(maxsize=64)
+def _which(name: str) -> Optional[str]:
+    """Cached shutil.which; cleared after installing packages"""
+    return shutil.which(name)
+
+
+# Read size for streamed downloads; small chunks make large release tarballs slow
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# Shared HTTP session so GitHub API and release downloads reuse pooled connections
+_HTTP_SESSION = requests.Session()
+_HTTP_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=4,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+    ),
+)
 
 
 @dataclass
@@ -28,6 +81,32 @@ class SystemInfo:
     package_manager: str  # Package manager
 
 
+@dataclass(slots=True)
+class TestResult:
+    """Result record of a single test command"""
+
+    status: str  # "success", "error" or "skipped"
+    command: str  # Command line as executed
+    timestamp_ns: int  # Completion time (time.time_ns())
+    output_file: Optional[str] = None  # Log file holding the raw stdout
+    parsed: Optional[Dict] = None  # Result fields extracted from the output
+    error: Optional[str] = None  # stderr or exception text on failure
+    reason: Optional[str] = None  # Why the test was skipped
+
+    def to_dict(self) -> Dict:
+        """Plain dict for JSON output, without unset fields"""
+        return {key: value for key, value in asdict(self).items() if value is not None}
+
+
+class ResourceClass(Enum):
+    """Resource a test mainly stresses; tests sharing a class never run concurrently"""
+
+    CPU = "cpu"
+    MEM = "mem"
+    DISK = "disk"
+    NET = "net"
+
+
 class PackageInstaller:
     """Unified package installer"""
 
@@ -52,7 +131,6 @@ class PackageInstaller:
 
     def __init__(self, system_info: SystemInfo):
         self.system_info = system_info
-        self.logger = logging.getLogger("sysbench_tester")
 
     def install(self, package_name: str) -> bool:
         try:
@@ -60,35 +138,42 @@ class PackageInstaller:
             commands = self.INSTALL_COMMANDS.get(pkg_manager)
 
             if not commands:
-                self.logger.error(f"Unsupported package manager: {pkg_manager}")
+                logger.error("Unsupported package manager: %s", pkg_manager)
                 return False
 
             # Run update if available
             if "update" in commands:
-                subprocess.run(commands["update"], check=True)
+                self._run_quiet(commands["update"])
 
             # Run pre-install if available
             if "pre_install" in commands:
-                subprocess.run(commands["pre_install"], check=True)
+                self._run_quiet(commands["pre_install"])
 
             # Run install
             install_cmd = [arg.format(package=package_name) for arg in commands["install"]]
-            subprocess.run(install_cmd, check=True)
+            self._run_quiet(install_cmd)
+            _which.cache_clear()
             return True
 
         except subprocess.CalledProcessError as e:
-            self.logger.error(f"Installation failed: {str(e)}")
+            logger.error("Installation failed: %s", e)
+            if e.stderr:
+                logger.error(e.stderr.strip())
             return False
 
+    @staticmethod
+    def _run_quiet(command: List[str]):
+        """Run a package manager command, discarding its progress output but keeping errors"""
+        subprocess.run(command, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+
 
 class SystemDetector:
     """System information detector"""
 
-    def __init__(self):
-        self.logger = logging.getLogger("sysbench_tester")
-
-    def detect_arch(self) -> str:
-        """Detect system architecture"""
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def detect_arch() -> str:
+        """Detect system architecture (cached)"""
         arch = platform.machine().lower()
         if arch in ["x86_64", "amd64"]:
             return "amd64"
@@ -99,21 +184,37 @@ class SystemDetector:
         else:
             return arch
 
-    def detect_package_manager(self) -> str:
-        """Detect system package manager"""
-        if shutil.which("apt"):
-            return "apt"
-        elif shutil.which("dnf"):
-            return "dnf"
-        elif shutil.which("yum"):
-            return "yum"
-        elif shutil.which("pacman"):
-            return "pacman"
+    PACKAGE_MANAGERS = ("apt", "dnf", "yum", "pacman")
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def detect_package_manager() -> str:
+        """Detect system package manager (cached, including an "unknown" result)
+
+        Each PATH directory is listed once and checked for all candidates, instead of one
+        PATH walk per candidate.
+        """
+        found = set()
+        for directory in os.environ.get("PATH", os.defpath).split(os.pathsep):
+            try:
+                with os.scandir(directory or os.curdir) as entries:
+                    for entry in entries:
+                        if (
+                            entry.name in SystemDetector.PACKAGE_MANAGERS
+                            and entry.is_file()
+                            and os.access(entry.path, os.X_OK)
+                        ):
+                            found.add(entry.name)
+            except OSError:
+                continue
+            if SystemDetector.PACKAGE_MANAGERS[0] in found:
+                break
+        for name in SystemDetector.PACKAGE_MANAGERS:
+            if name in found:
+                return name
         return "unknown"
 
     def get_system_info(self) -> SystemInfo:
-        import distro
-
         """Get complete system information"""
         arch = self.detect_arch()
         pkg_manager = self.detect_package_manager()
@@ -123,26 +224,46 @@ class SystemDetector:
         )
 
 
+@functools.lru_cache(maxsize=1)
+def get_cached_system_info() -> SystemInfo:
+    """Detect the host once per process, it does not change during a run"""
+    return SystemDetector().get_system_info()
+
+
 class PackageManager:
     """Package management system"""
 
     def __init__(self, system_info: SystemInfo):
         self.system_info = system_info
-        self.logger = logging.getLogger("sysbench_tester")
         self.installer = PackageInstaller(self.system_info)
 
-    def download_package_from_githubrelease(self, url: str, output_path: str) -> bool:
+    def download_package_from_githubrelease(self, url: str, output_path: Path) -> bool:
         """Download package from URL"""
         try:
-            response = requests.get(url, stream=True)
+            response = _HTTP_SESSION.get(url, stream=True, timeout=30)
             response.raise_for_status()
 
             with open(output_path, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
                     f.write(chunk)
             return True
         except Exception as e:
-            self.logger.error(f"Failed to download package: {str(e)}")
+            logger.error("Failed to download package: %s", e)
+            return False
+
+    def extract_package_from_githubrelease(self, url: str, output_dir: Path) -> bool:
+        """Download a .tar.gz release and extract it straight from the HTTP stream"""
+        try:
+            with _HTTP_SESSION.get(url, stream=True, timeout=30) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                # The "data" filter rejects absolute paths and members escaping output_dir
+                extract_kwargs = {"filter": "data"} if hasattr(tarfile, "data_filter") else {}
+                with tarfile.open(fileobj=response.raw, mode="r|gz") as tar:
+                    tar.extractall(path=output_dir, **extract_kwargs)
+            return True
+        except Exception as e:
+            logger.error("Failed to download or extract package: %s", e)
             return False
 
     def install_package(self, package_name: str, release_url: Optional[str] = None) -> bool:
@@ -154,7 +275,7 @@ class PackageManager:
         """
         if release_url:
             with tempfile.TemporaryDirectory() as temp_dir:
-                package_path = os.path.join(temp_dir, f"{package_name}.tar.gz")
+                package_path = Path(temp_dir) / f"{package_name}.tar.gz"
                 if self.download_package_from_githubrelease(release_url, package_path):  # 修正方法名
                     local_installer = PackageInstaller(self.system_info)
                     return local_installer.install(package_path)
@@ -191,9 +312,14 @@ class CustomFormatter(logging.Formatter):
         logging.CRITICAL: Colors.PURPLE + format_str + Colors.RESET,
     }
 
+    def __init__(self):
+        super().__init__()
+        self._formatters = {
+            level: logging.Formatter(fmt, datefmt="%Y-%m-%d %H:%M:%S") for level, fmt in self.FORMATS.items()
+        }
+
     def format(self, record):
-        log_fmt = self.FORMATS.get(record.levelno)
-        formatter = logging.Formatter(log_fmt, datefmt="%Y-%m-%d %H:%M:%S")
+        formatter = self._formatters.get(record.levelno, self._formatters[logging.INFO])
         return formatter.format(record)
 
 
@@ -213,14 +339,55 @@ def initialize_logger():
 logger = initialize_logger()
 
 
+def write_json(path: Path, data) -> None:
+    """Write data as indented JSON, using orjson when it is installed
+
+    The file is written next to ``path`` and renamed into place, so a crash never
+    leaves a truncated file behind.
+    """
+    tmp_path = f"{path}.tmp"
+    if orjson is not None:
+        with open(tmp_path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(tmp_path, "w") as f:
+            json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def read_config_file(path: Path) -> Dict:
+    """Parse a config file by extension: .toml, .json, otherwise YAML"""
+    suffix = path.suffix.lower()
+    if suffix == ".toml":
+        if tomllib is None:
+            raise RuntimeError("TOML configuration requires Python 3.11+")
+        with open(path, "rb") as f:
+            return tomllib.load(f)
+    if suffix == ".json":
+        data = path.read_bytes()
+        return orjson.loads(data) if orjson is not None else json.loads(data)
+    with open(path, "r") as f:
+        return yaml.load(f, Loader=YamlLoader)
+
+
+# Parsed config files keyed by (absolute path, mtime_ns, size), least recently used first
+_CONFIG_CACHE: "OrderedDict[Tuple[str, int, int], Dict]" = OrderedDict()
+_CONFIG_CACHE_SIZE = 16
+_CONFIG_CACHE_LOCK = threading.Lock()
+
+
 def load_config(config_path: str = "config.yaml") -> Dict:
-    """Load test configuration from YAML file"""
+    """Load test configuration from a YAML, TOML or JSON file
+
+    Parsed files are cached until they change on disk; callers always get their own copy.
+    """
     default_config = {
-        "global": {"enabled_tests": ["cpu", "memory", "fileio"]},
+        "global": {"enabled_tests": ["cpu", "memory", "fileio"], "parallel": False, "log_level": "INFO"},
         "cpu": {
             "enabled": True,
             "single_thread": {"enabled": True, "events": 0, "time": 30, "threads": 1},
             "multi_thread": {"enabled": True, "events": 0, "time": 30, "threads": "auto"},
+            "affinity": {"enabled": False},
         },
         "memory": {
             "enabled": True,
@@ -244,34 +411,44 @@ def load_config(config_path: str = "config.yaml") -> Dict:
     }
 
     config_path = Path(config_path)
-    if not config_path.exists():
-        logger.warning(f"Config file {config_path} not found, using default configuration")
+    try:
+        st = config_path.stat()
+    except OSError:
+        logger.warning("Config file %s not found, using default configuration", config_path)
         return default_config
 
+    key = (os.path.abspath(config_path), st.st_mtime_ns, st.st_size)
+    with _CONFIG_CACHE_LOCK:
+        if key in _CONFIG_CACHE:
+            _CONFIG_CACHE.move_to_end(key)
+            return copy.deepcopy(_CONFIG_CACHE[key])
+
     try:
-        with open(config_path, "r") as f:
-            config = yaml.safe_load(f)
-            logger.info(f"Loaded configuration from {config_path}")
-            return config
+        config = read_config_file(config_path)
+        logger.info("Loaded configuration from %s", config_path)
     except Exception as e:
-        logger.error(f"Error loading config file: {str(e)}")
+        logger.error("Error loading config file: %s", e)
         logger.warning("Using default configuration")
         return default_config
 
+    with _CONFIG_CACHE_LOCK:
+        _CONFIG_CACHE[key] = config
+        while len(_CONFIG_CACHE) > _CONFIG_CACHE_SIZE:
+            _CONFIG_CACHE.popitem(last=False)
+    return copy.deepcopy(config)
+
 
 def install_sysbench():
     """Install sysbench if not present"""
     logger.info("Checking sysbench...")
 
     # Check if sysbench is already installed
-    if shutil.which("sysbench"):
+    if _which("sysbench"):
         logger.info("sysbench is already installed")
         return True
 
     # Detect system information and create package manager
-    detector = SystemDetector()
-    system_info = detector.get_system_info()
-    pkg_manager = PackageManager(system_info)
+    pkg_manager = PackageManager(get_cached_system_info())
 
     return pkg_manager.install_package("sysbench")
 
@@ -281,7 +458,7 @@ def get_latest_fastfetch_release(arch: str) -> str:
     try:
         # 获取最新版本信息
         api_url = "https://api.github.com/repos/fastfetch-cli/fastfetch/releases/latest"
-        response = requests.get(api_url, timeout=10)
+        response = _HTTP_SESSION.get(api_url, timeout=10)
         response.raise_for_status()
         release_info = response.json()
 
@@ -291,29 +468,26 @@ def get_latest_fastfetch_release(arch: str) -> str:
         # 构建下载URL
         download_url = f"https://github.com/fastfetch-cli/fastfetch/releases/download/{latest_version}/fastfetch-linux-{arch}.tar.gz"
 
-        logger.info(f"Found latest fastfetch version: {latest_version}")
+        logger.info("Found latest fastfetch version: %s", latest_version)
         return download_url
     except Exception as e:
         # 如果API调用失败，回退到固定版本
         fallback_version = "2.38.0"
-        logger.warning(f"Failed to get latest fastfetch version: {str(e)}")
-        logger.warning(f"Falling back to version {fallback_version}")
+        logger.warning("Failed to get latest fastfetch version: %s", e)
+        logger.warning("Falling back to version %s", fallback_version)
         return f"https://github.com/fastfetch-cli/fastfetch/releases/download/{fallback_version}/fastfetch-linux-{arch}.tar.gz"
 
 
 def install_fastfetch():
     """Install fastfetch with system detection"""
-    logger = logging.getLogger("sysbench_tester")
-
     # Check if already installed
-    if shutil.which("fastfetch"):
+    if _which("fastfetch"):
         logger.info("fastfetch is already installed")
         return True
 
     # Detect system information
-    detector = SystemDetector()
-    system_info = detector.get_system_info()
-    logger.info(f"Detected system: {system_info}")
+    system_info = get_cached_system_info()
+    logger.info("Detected system: %s", system_info)
 
     # Create package manager
     pkg_manager = PackageManager(system_info)
@@ -323,29 +497,68 @@ def install_fastfetch():
 
     # fastfetch release URL template
     release_url = get_latest_fastfetch_release(system_info.arch)
-    # Download and install from release
+    # Download, extract and install from release
     with tempfile.TemporaryDirectory() as temp_dir:
-        package_path = os.path.join(temp_dir, "fastfetch.tar.gz")
-        if pkg_manager.download_package_from_githubrelease(release_url, package_path):
-            # Extract and install from tar.gz
+        if pkg_manager.extract_package_from_githubrelease(release_url, Path(temp_dir)):
             try:
-                with tarfile.open(package_path, "r:gz") as tar:
-                    tar.extractall(path=temp_dir)
                 # Find the binary and move it to /usr/local/bin
-                binary_path = os.path.join(temp_dir, "fastfetch")
-                if os.path.exists(binary_path):
+                binary_path = Path(temp_dir) / "fastfetch"
+                if binary_path.exists():
                     subprocess.run(["sudo", "mv", binary_path, "/usr/local/bin/"], check=True)
                     subprocess.run(["sudo", "chmod", "+x", "/usr/local/bin/fastfetch"], check=True)
+                    _which.cache_clear()
                     return True
             except Exception as e:
-                logger.error(f"Failed to install fastfetch from release: {str(e)}")
+                logger.error("Failed to install fastfetch from release: %s", e)
                 return False
 
     return False
 
 
+def _format_size(num_bytes) -> str:
+    """Format a byte count as GiB"""
+    return f"{(num_bytes or 0) / (1 << 30):.2f} GiB"
+
+
+def _format_usage(usage: Dict) -> str:
+    return f"{_format_size(usage.get('used'))} / {_format_size(usage.get('total'))}"
+
+
+def _join_words(*words) -> str:
+    return " ".join(str(word) for word in words if word)
+
+
+# fastfetch modules kept for the report, in display order, with the function reducing
+# each module's "result" to a one-line display string
+SYSINFO_FORMATTERS: Dict[str, Callable[[Any], str]] = {
+    "OS": lambda r: r.get("prettyName") or _join_words(r.get("name"), r.get("version")),
+    "Host": lambda r: r.get("name") or r.get("family", ""),
+    "Kernel": lambda r: _join_words(r.get("name"), r.get("release")),
+    "CPU": lambda r: _join_words(
+        r.get("cpu"), f"({r['cores']['logical']} threads)" if r.get("cores", {}).get("logical") else None
+    ),
+    "GPU": lambda r: ", ".join(gpu.get("name", "") for gpu in r),
+    "Memory": _format_usage,
+    "Disk": lambda r: "; ".join(f"{disk.get('mountpoint')}: {_format_usage(disk.get('bytes', {}))}" for disk in r),
+}
+SYSINFO_KEYS = tuple(SYSINFO_FORMATTERS)
+
+
+def _format_sysinfo(module_type: str, result) -> str:
+    """Reduce a fastfetch module result to a display string, falling back to its JSON form"""
+    try:
+        return SYSINFO_FORMATTERS[module_type](result)
+    except (AttributeError, KeyError, TypeError):
+        return json.dumps(result)
+
+
+@functools.lru_cache(maxsize=1)
 def get_system_info() -> Dict:
-    """Collect system information using fastfetch"""
+    """Collect system information using fastfetch
+
+    The result is cached for the lifetime of the process; call
+    ``get_system_info.cache_clear()`` to collect it again.
+    """
     if not install_fastfetch():
         logger.error("Failed to install fastfetch")
         return {}
@@ -353,23 +566,103 @@ def get_system_info() -> Dict:
     try:
         # Use --json format to get system information
         result = subprocess.run(["fastfetch", "--json"], capture_output=True, text=True, check=True)
-        system_info = json.loads(result.stdout)
+        modules = json.loads(result.stdout)
+        # fastfetch emits a list of {"type": ..., "result": ...} modules; keep only the ones we report
+        if not isinstance(modules, list) or not all(isinstance(module, dict) for module in modules):
+            logger.error("Unexpected fastfetch output format: %s", type(modules).__name__)
+            return {}
+        system_info = {
+            module["type"]: _format_sysinfo(module["type"], module["result"])
+            for module in modules
+            if module.get("type") in SYSINFO_KEYS and "result" in module
+        }
         logger.info("System information collected successfully")
         return system_info
     except subprocess.CalledProcessError as e:
-        logger.error(f"Failed to get system information: {str(e)}")
+        logger.error("Failed to get system information: %s", e)
         return {}
     except json.JSONDecodeError as e:
-        logger.error(f"Failed to parse system information: {str(e)}")
+        logger.error("Failed to parse system information: %s", e)
         return {}
 
 
+class SysbenchOutputParser:
+    """Extract the result fields of one test kind from sysbench output"""
+
+    # "<label>: <value>" lines of interest per test kind -> result field
+    MARKERS = {
+        "cpu": {
+            "Number of threads": "threads",
+            "total time": "time",
+            "events per second": "events_per_second",
+        },
+        "memory": {
+            "block size": "block_size",
+            "total time": "total_time",
+            "sum": "latency_sum",
+        },
+        "fileio": {
+            "read, MiB/s": "read_throughput",
+            "written, MiB/s": "write_throughput",
+            "sum": "latency_sum",
+        },
+    }
+    # Fields whose line has no "<label>:" prefix, e.g. "102400.00 MiB transferred (10240.00 MiB/sec)"
+    UNLABELED = {
+        "memory": {"transfer_speed": re.compile(rb"MiB transferred \(([^)]*)\)")},
+    }
+
+    def __init__(self, kind: str):
+        self.kind = kind
+        self.markers = self.MARKERS[kind]
+        self.unlabeled = self.UNLABELED.get(kind, {})
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _label_re(cls, kind: str) -> "re.Pattern":
+        labels = b"|".join(re.escape(label.encode()) for label in cls.MARKERS[kind])
+        return re.compile(rb"^[ \t]*(" + labels + rb"):[ \t]*(.*?)[ \t\r]*$", re.MULTILINE)
+
+    def parse(self, data) -> Dict:
+        """Scan a bytes-like buffer once; only the matched values are decoded"""
+        found = {}
+        for match in self._label_re(self.kind).finditer(data):
+            # First match wins for every field
+            found.setdefault(self.markers[match.group(1).decode()], match.group(2))
+        for field, pattern in self.unlabeled.items():
+            match = pattern.search(data)
+            if match:
+                found[field] = match.group(1)
+
+        fields = dict.fromkeys([*self.markers.values(), *self.unlabeled])
+        fields.update((field, value.decode(errors="replace")) for field, value in found.items())
+        return fields
+
+    def parse_file(self, path: Path) -> Dict:
+        """Parse a finished output file through an mmap, without reading it into memory"""
+        if not path.stat().st_size:
+            return self.parse(b"")
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return self.parse(mm)
+
+
 # TODO Add system information detection
 # TODO Add network performance testing
 class SysbenchTester:
+    # Records the size/count of the fileio test files left by the last prepare
+    FILEIO_STAMP = ".sysbench_fileio.stamp"
+
     def __init__(self, config_path: str = "config.yaml"):
         # Load configuration
         self.config = load_config(config_path)
+        # Overlap tests of different resource classes; off by default since concurrent tests skew each other's numbers
+        self.parallel = self.config["global"].get("parallel", False)
+        # DEBUG also echoes every line of test output live
+        log_level = str(self.config["global"].get("log_level", "INFO")).upper()
+        if isinstance(logging.getLevelName(log_level), int):
+            logger.setLevel(log_level)
+        else:
+            logger.warning("Unknown log_level %r, keeping INFO", log_level)
 
         # Check and install sysbench at program start
         if not install_sysbench():
@@ -377,38 +670,80 @@ class SysbenchTester:
             sys.exit(1)
 
         self.results = {"system_info": {}, "benchmark_results": {}}
+        self._results_lock = threading.Lock()
+        # Set on Ctrl-C in parallel mode so worker threads start no further tests
+        self._stop = threading.Event()
         self.timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-        self.result_dir = f"results_{self.timestamp}"
-        os.makedirs(self.result_dir, exist_ok=True)
-        logger.info(f"Created results directory: {self.result_dir}")
+        self.result_dir = Path(f"results_{self.timestamp}")
+        self._json_path = self.result_dir / "raw_results.json"
+        self._report_path = self.result_dir / "report.txt"
+        self.result_dir.mkdir(parents=True, exist_ok=True)
+        logger.info("Created results directory: %s", self.result_dir)
 
         # Collect system information
         logger.info("Collecting system information...")
         self.results["system_info"] = get_system_info()
 
-    def run_command(self, command: str, test_name: str) -> Dict:
-        """Execute command and return results"""
-        logger.info(f"Executing test: {test_name}")
-        logger.debug(f"Command: {command}")
+    def run_command(
+        self,
+        argv: List[str],
+        test_name: str,
+        output_path: Path,
+        kind: Optional[str] = None,
+    ) -> TestResult:
+        """Execute command and return results
+
+        stdout is written to ``output_path`` as it is produced, and echoed to the debug
+        log line by line. Only the fields of ``kind`` are parsed back into the record.
+        """
+        command = shlex.join(argv)
+        logger.info("Executing test: %s", test_name)
+        logger.debug("Command: %s", command)
 
         try:
-            result = subprocess.run(command, shell=True, capture_output=True, text=True, check=True)
-            logger.debug("Command executed successfully")
-            return {
-                "status": "success",
-                "output": result.stdout,
-                "command": command,
-                "timestamp": datetime.datetime.now().isoformat(),
-            }
-        except subprocess.CalledProcessError as e:
-            logger.error(f"Command execution failed: {str(e)}")
-            return {
-                "status": "error",
-                "output": e.stdout if e.stdout else str(e),
-                "error": e.stderr if e.stderr else str(e),
-                "command": command,
-                "timestamp": datetime.datetime.now().isoformat(),
-            }
+            # stderr goes straight to a file so it never blocks the stdout reader
+            with open(output_path, "w") as stdout_file, tempfile.TemporaryFile("w+") as stderr_file:
+                with subprocess.Popen(argv, stdout=subprocess.PIPE, stderr=stderr_file, text=True, bufsize=1) as proc:
+                    for line in proc.stdout:
+                        stdout_file.write(line)
+                        logger.debug("[%s] %s", test_name, line.rstrip())
+                stderr_file.seek(0)
+                stderr = stderr_file.read()
+        except OSError as e:
+            logger.error("Command execution failed: %s", e)
+            return TestResult(status="error", command=command, timestamp_ns=time.time_ns(), error=str(e))
+
+        if proc.returncode != 0:
+            error = str(subprocess.CalledProcessError(proc.returncode, command))
+            logger.error("Command execution failed: %s", error)
+            return TestResult(
+                status="error",
+                command=command,
+                timestamp_ns=time.time_ns(),
+                output_file=str(output_path),
+                error=stderr or error,
+            )
+
+        logger.debug("Command executed successfully")
+        return TestResult(
+            status="success",
+            command=command,
+            timestamp_ns=time.time_ns(),
+            output_file=str(output_path),
+            parsed=SysbenchOutputParser(kind).parse_file(output_path) if kind else None,
+        )
+
+    def _store(self, key: str, argv: List[str], test_name: str, kind: Optional[str] = None) -> TestResult:
+        """Run a test and record its result (safe to call from worker threads)"""
+        if self._stop.is_set():
+            return TestResult(
+                status="skipped", command=shlex.join(argv), timestamp_ns=time.time_ns(), reason="Run interrupted"
+            )
+        output_path = self.result_dir / f"{key}.log"
+        result = self.run_command(argv, test_name, output_path, kind)
+        with self._results_lock:
+            self.results["benchmark_results"][key] = result
+        return result
 
     def run_cpu_tests(self):
         """Run CPU benchmark tests"""
@@ -419,19 +754,49 @@ class SysbenchTester:
         # Single-thread CPU test
         if self.config["cpu"]["single_thread"]["enabled"]:
             cfg = self.config["cpu"]["single_thread"]
-            self.results["benchmark_results"]["cpu_single_thread"] = self.run_command(
-                f"sysbench cpu --events={cfg['events']} --time={cfg['time']} --threads={cfg['threads']} run",
+            self._store(
+                "cpu_single_thread",
+                [
+                    "sysbench",
+                    "cpu",
+                    f"--events={cfg['events']}",
+                    f"--time={cfg['time']}",
+                    f"--threads={cfg['threads']}",
+                    "run",
+                ],
                 "CPU Single Thread Test",
+                "cpu",
             )
 
         # Multi-thread CPU test
         if self.config["cpu"]["multi_thread"]["enabled"]:
             cfg = self.config["cpu"]["multi_thread"]
-            threads = multiprocessing.cpu_count() if cfg["threads"] == "auto" else cfg["threads"]
-            self.results["benchmark_results"]["cpu_multi_thread"] = self.run_command(
-                f"sysbench cpu --events={cfg['events']} --time={cfg['time']} --threads={threads} run",
-                f"CPU Multi-Thread Test ({threads} threads)",
-            )
+            threads = CPU_COUNT if cfg["threads"] == "auto" else cfg["threads"]
+            argv = [
+                "sysbench",
+                "cpu",
+                f"--events={cfg['events']}",
+                f"--time={cfg['time']}",
+                f"--threads={threads}",
+                "run",
+            ]
+            if self.config["cpu"].get("affinity", {}).get("enabled", False):
+                argv = self._pin_to_cpus(argv, int(threads))
+            self._store("cpu_multi_thread", argv, f"CPU Multi-Thread Test ({threads} threads)", "cpu")
+
+    @staticmethod
+    def _pin_to_cpus(argv: List[str], threads: int) -> List[str]:
+        """Restrict a command to the first ``threads`` CPUs this process may run on
+
+        Wraps the command in taskset; without it the command runs unpinned, since a
+        preexec_fn is not safe while worker threads are spawning other tests.
+        """
+        if not _which("taskset"):
+            logger.warning("taskset not found, running without CPU affinity")
+            return argv
+        cpus = sorted(os.sched_getaffinity(0))[:threads]
+        logger.debug("Pinning to CPUs: %s", cpus)
+        return ["taskset", "-c", ",".join(map(str, cpus))] + argv
 
     def run_memory_test(self):
         """Run memory benchmark test"""
@@ -440,10 +805,19 @@ class SysbenchTester:
             return
 
         cfg = self.config["memory"]
-        self.results["benchmark_results"]["memory"] = self.run_command(
-            f"sysbench memory --threads={cfg['threads']} --time={cfg['time']} "
-            f"--memory-block-size={cfg['block_size']} --memory-total-size={cfg['total_size']} run",
+        self._store(
+            "memory",
+            [
+                "sysbench",
+                "memory",
+                f"--threads={cfg['threads']}",
+                f"--time={cfg['time']}",
+                f"--memory-block-size={cfg['block_size']}",
+                f"--memory-total-size={cfg['total_size']}",
+                "run",
+            ],
             "Memory Test",
+            "memory",
         )
 
     def run_fileio_tests(self):
@@ -453,30 +827,63 @@ class SysbenchTester:
             return
 
         cfg = self.config["fileio"]
-
-        # Prepare files
-        self.results["benchmark_results"]["fileio_prepare"] = self.run_command(
-            f"sysbench fileio --file-total-size={cfg['file_total_size']} --file-num={cfg['file_num']} prepare",
-            "File I/O Preparation",
-        )
+        # Shared by prepare, every test mode and cleanup
+        argv_prefix = [
+            "sysbench",
+            "fileio",
+            f"--file-total-size={cfg['file_total_size']}",
+            f"--file-num={cfg['file_num']}",
+        ]
+
+        # Prepare files, unless an identical set is left over from a previous run
+        prepare_argv = argv_prefix + ["prepare"]
+        if self._fileio_prepared(cfg):
+            logger.info("Reusing test files from a previous File I/O Preparation")
+            with self._results_lock:
+                self.results["benchmark_results"]["fileio_prepare"] = TestResult(
+                    status="skipped",
+                    command=shlex.join(prepare_argv),
+                    timestamp_ns=time.time_ns(),
+                    reason=f"Test files match {self.FILEIO_STAMP}, prepare skipped",
+                )
+        elif self._store("fileio_prepare", prepare_argv, "File I/O Preparation").status == "success":
+            Path(self.FILEIO_STAMP).write_text(json.dumps(self._fileio_fingerprint(cfg)))
 
         # Run enabled test modes
+        run_argv_prefix = argv_prefix + [f"--threads={cfg['threads']}", f"--time={cfg['time']}"]
         for mode in cfg["modes"]:
             if mode["enabled"]:
-                test_name = f"fileio_{mode['name']}"
-                self.results["benchmark_results"][test_name] = self.run_command(
-                    f"sysbench fileio --file-total-size={cfg['file_total_size']} "
-                    f"--file-num={cfg['file_num']} --threads={cfg['threads']} "
-                    f"--time={cfg['time']} --file-test-mode={mode['name']} run",
+                self._store(
+                    f"fileio_{mode['name']}",
+                    run_argv_prefix + [f"--file-test-mode={mode['name']}", "run"],
                     f"File I/O {mode['name'].upper()} Test",
+                    "fileio",
                 )
 
         # Cleanup files if configured
         if cfg["cleanup"]:
-            self.results["benchmark_results"]["fileio_cleanup"] = self.run_command(
-                f"sysbench fileio --file-total-size={cfg['file_total_size']} --file-num={cfg['file_num']} cleanup",
-                "File I/O Cleanup",
-            )
+            self._store("fileio_cleanup", argv_prefix + ["cleanup"], "File I/O Cleanup")
+            Path(self.FILEIO_STAMP).unlink(missing_ok=True)
+
+    @staticmethod
+    def _fileio_fingerprint(cfg: Dict) -> Dict:
+        """Describe the sysbench test files currently in the working directory"""
+        files = sorted(glob.glob("test_file.*"))
+        return {
+            "size": cfg["file_total_size"],
+            "num": cfg["file_num"],
+            "files": files,
+            "bytes": sum(os.path.getsize(name) for name in files),
+        }
+
+    def _fileio_prepared(self, cfg: Dict) -> bool:
+        """Whether the files from a previous prepare match the requested size and count"""
+        try:
+            stamp = json.loads(Path(self.FILEIO_STAMP).read_text())
+        except (OSError, ValueError):
+            return False
+        fingerprint = self._fileio_fingerprint(cfg)
+        return bool(fingerprint["files"]) and stamp == fingerprint
 
     def run_network_test(self):
         """Run network benchmark tests"""
@@ -487,179 +894,194 @@ class SysbenchTester:
         cfg = self.config["network"]
 
         # 检查iperf3是否已安装
-        if not shutil.which("iperf3"):
-            detector = SystemDetector()
-            system_info = detector.get_system_info()
-            pkg_manager = PackageManager(system_info)
+        if not _which("iperf3"):
+            pkg_manager = PackageManager(get_cached_system_info())
             if not pkg_manager.install_package("iperf3"):
                 logger.error("Failed to install iperf3, skipping network tests")
                 return
 
         # 运行iperf3测试
         if cfg.get("server_ip"):
-            self.results["benchmark_results"]["network"] = self.run_command(
-                f"iperf3 -c {cfg['server_ip']} -t {cfg.get('time', 10)} -J", "Network Speed Test"
+            result = self._store(
+                "network",
+                ["iperf3", "-c", str(cfg["server_ip"]), "-t", str(cfg.get("time", 10)), "-J"],
+                "Network Speed Test",
             )
+            # Decode the iperf3 JSON once and keep only the summary
+            if result.status == "success":
+                try:
+                    result.parsed = self._parse_network_result(json.loads(Path(result.output_file).read_text()))
+                except json.JSONDecodeError:
+                    result.parsed = {"error": "Failed to parse iperf3 JSON output"}
         else:
             logger.warning("Network test enabled but no server IP specified")
 
+    def _test_table(self) -> List[Tuple[str, ResourceClass, Callable[[], None]]]:
+        """(name, resource class, runner) for every supported test"""
+        return [
+            ("cpu", ResourceClass.CPU, self.run_cpu_tests),
+            ("memory", ResourceClass.MEM, self.run_memory_test),
+            ("fileio", ResourceClass.DISK, self.run_fileio_tests),
+            ("network", ResourceClass.NET, self.run_network_test),
+        ]
+
+    def _run_serially(self, runners: List[Callable[[], None]]):
+        for runner in runners:
+            if self._stop.is_set():
+                return
+            runner()
+
+    @staticmethod
+    def _worker_count(default: int) -> int:
+        """Worker count from SYSBENCH_CLIENTS, falling back to default when unset or invalid"""
+        value = os.environ.get("SYSBENCH_CLIENTS")
+        if not value:
+            return max(default, 1)
+        try:
+            workers = int(value)
+        except ValueError:
+            workers = 0
+        if workers < 1:
+            logger.warning("Ignoring invalid SYSBENCH_CLIENTS=%r, using %s worker(s)", value, default)
+            return max(default, 1)
+        return workers
+
     def run_enabled_tests(self):
         """Run all enabled tests according to configuration"""
         enabled_tests = self.config["global"]["enabled_tests"]
+        table = {name: (resource, runner) for name, resource, runner in self._test_table()}
 
+        # Group enabled tests by conflict group (their resource class unless overridden in the
+        # test's config section), keeping the configured order within each group
+        groups: Dict[str, List[Callable[[], None]]] = {}
         for test in enabled_tests:
-            if test == "cpu" and self.config["cpu"]["enabled"]:
-                self.run_cpu_tests()
-            elif test == "memory" and self.config["memory"]["enabled"]:
-                self.run_memory_test()
-            elif test == "fileio" and self.config["fileio"]["enabled"]:
-                self.run_fileio_tests()
-            elif test == "network" and self.config.get("network", {}).get("enabled", False):
-                self.run_network_test()
-
-    def _parse_cpu_result(self, output: str) -> Dict:
-        """Parse CPU test results"""
-        lines = output.split("\n")
-        result = {"threads": None, "time": None, "events_per_second": None}
-
-        for line in lines:
-            if "Number of threads:" in line:
-                result["threads"] = line.split(":")[1].strip()
-            elif "total time:" in line:
-                result["time"] = line.split(":")[1].strip()
-            elif "events per second:" in line:
-                result["events_per_second"] = line.split(":")[1].strip()
+            cfg = self.config.get(test, {})
+            if test in table and cfg.get("enabled", False):
+                resource, runner = table[test]
+                groups.setdefault(cfg.get("conflict_group", resource.value), []).append(runner)
 
-        return result
-
-    def _parse_memory_result(self, output: str) -> Dict:
-        """Parse memory test results"""
-        lines = output.split("\n")
-        result = {"block_size": None, "transfer_speed": None, "total_time": None, "latency_sum": None}
-
-        for line in lines:
-            if "block size:" in line:
-                result["block_size"] = line.split(":")[1].strip()
-            elif "MiB transferred" in line:
-                result["transfer_speed"] = line.split("(")[1].split(")")[0]
-            elif "total time:" in line:
-                result["total_time"] = line.split(":")[1].strip()
-            elif "sum:" in line and result["latency_sum"] is None:
-                result["latency_sum"] = line.split(":")[1].strip()
-
-        return result
-
-    def _parse_fileio_result(self, output: str) -> Dict:
-        """Parse file I/O test results"""
-        lines = output.split("\n")
-        result = {"read_throughput": None, "write_throughput": None, "latency_sum": None}
+        if not groups:
+            return
 
-        for line in lines:
-            if "read, MiB/s:" in line:
-                result["read_throughput"] = line.split(":")[1].strip()
-            elif "written, MiB/s:" in line:
-                result["write_throughput"] = line.split(":")[1].strip()
-            elif "sum:" in line and result["latency_sum"] is None:
-                result["latency_sum"] = line.split(":")[1].strip()
+        # Serial runs stay on the main thread so Ctrl-C stops them immediately
+        if not self.parallel:
+            self._run_serially([runner for runners in groups.values() for runner in runners])
+            return
 
-        return result
+        workers = self._worker_count(len(groups))
+        logger.debug("Running %s test group(s) with %s worker(s)", len(groups), workers)
 
-    def _parse_network_result(self, output: str) -> Dict:
-        """Parse network test results"""
+        executor = ThreadPoolExecutor(max_workers=workers)
         try:
-            result = json.loads(output)
-            return {
-                "send_speed": f"{result.get('end', {}).get('sum_sent', {}).get('bits_per_second', 0) / 1000000:.2f} Mbps",
-                "recv_speed": f"{result.get('end', {}).get('sum_received', {}).get('bits_per_second', 0) / 1000000:.2f} Mbps",
-                "retransmits": result.get("end", {}).get("sum_sent", {}).get("retransmits", 0),
-            }
-        except json.JSONDecodeError:
-            return {"error": "Failed to parse iperf3 JSON output"}
+            # Consume the iterator so exceptions raised in workers propagate here
+            list(executor.map(self._run_serially, groups.values()))
+        except KeyboardInterrupt:
+            # Running tests receive the SIGINT too; keep workers from starting the rest
+            self._stop.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        executor.shutdown()
+
+    def _parse_network_result(self, result: Dict) -> Dict:
+        """Parse network test results from decoded iperf3 JSON"""
+        end = result.get("end", {})
+        return {
+            "send_speed": f"{end.get('sum_sent', {}).get('bits_per_second', 0) / 1000000:.2f} Mbps",
+            "recv_speed": f"{end.get('sum_received', {}).get('bits_per_second', 0) / 1000000:.2f} Mbps",
+            "retransmits": end.get("sum_sent", {}).get("retransmits", 0),
+        }
+
+    @staticmethod
+    def _format_timestamp(timestamp_ns: int) -> str:
+        return datetime.datetime.fromtimestamp(timestamp_ns / 1e9).isoformat(timespec="seconds")
 
     def save_results(self):
         """Save test results"""
         # Save raw JSON results
-        json_path = os.path.join(self.result_dir, "raw_results.json")
-        with open(json_path, "w") as f:
-            json.dump(self.results, f, indent=4)
-        logger.debug(f"Raw results saved to: {json_path}")
+        write_json(
+            self._json_path,
+            {
+                "system_info": self.results["system_info"],
+                "benchmark_results": {
+                    name: result.to_dict() for name, result in self.results["benchmark_results"].items()
+                },
+            },
+        )
+        logger.debug("Raw results saved to: %s", self._json_path)
 
         # Generate simplified human-readable report
-        report_path = os.path.join(self.result_dir, "report.txt")
-        with open(report_path, "w") as f:
-            f.write(f"Sysbench Performance Test Report (Simplified)\n")
-            f.write(f"Test Time: {self.timestamp}\n")
-            f.write("=" * 50 + "\n\n")
-
-            # System Information
-            f.write("System Information\n")
-            f.write("-" * 30 + "\n")
-            if self.results["system_info"]:
-                for key, value in self.results["system_info"].items():
-                    f.write(f"{key}: {value}\n")
-            else:
-                f.write("System information not available\n")
-            f.write("\n")
-
-            # CPU test results
-            for test_name in ["cpu_single_thread", "cpu_multi_thread"]:
-                if (
-                    test_name in self.results["benchmark_results"]
-                    and self.results["benchmark_results"][test_name]["status"] == "success"
-                ):
-                    result = self._parse_cpu_result(self.results["benchmark_results"][test_name]["output"])
-                    f.write(f"\nCPU Test - {'Single Thread' if 'single' in test_name else 'Multi Thread'}\n")
-                    f.write("-" * 30 + "\n")
-                    f.write(f"Test Threads: {result['threads']}\n")
-                    f.write(f"Test Duration: {result['time']}\n")
-                    f.write(f"CPU Speed: {result['events_per_second']} events/sec\n")
-
-            # Memory test results
-            if (
-                "memory" in self.results["benchmark_results"]
-                and self.results["benchmark_results"]["memory"]["status"] == "success"
-            ):
-                result = self._parse_memory_result(self.results["benchmark_results"]["memory"]["output"])
-                f.write(f"\nMemory Test\n")
-                f.write("-" * 30 + "\n")
-                f.write(f"Test Options: Block Size {result['block_size']}\n")
-                f.write(f"Transfer Speed: {result['transfer_speed']}\n")
-                f.write(f"Total Latency: {result['latency_sum']}\n")
-
-            # File I/O test results
-            for test_name in ["fileio_rndrw", "fileio_seqrd"]:
-                if (
-                    test_name in self.results["benchmark_results"]
-                    and self.results["benchmark_results"][test_name]["status"] == "success"
-                ):
-                    result = self._parse_fileio_result(
-                        self.results["benchmark_results"][test_name]["output"]
-                    )
-                    f.write(
-                        f"\nDisk Test - {'Random Read/Write' if 'rndrw' in test_name else 'Sequential Read'}\n"
-                    )
-                    f.write("-" * 30 + "\n")
-                    f.write(f"Read Speed: {result['read_throughput']} MiB/s\n")
-                    if result["write_throughput"]:
-                        f.write(f"Write Speed: {result['write_throughput']} MiB/s\n")
-                    f.write(f"Total Latency: {result['latency_sum']} ms\n")
-
-            # Network test results
-            if (
-                "network" in self.results["benchmark_results"]
-                and self.results["benchmark_results"]["network"]["status"] == "success"
-            ):
-                result = self._parse_network_result(self.results["benchmark_results"]["network"]["output"])
-                f.write(f"\nNetwork Test\n")
-                f.write("-" * 30 + "\n")
-                f.write(f"Send Speed: {result.get('send_speed', 'N/A')}\n")
-                f.write(f"Receive Speed: {result.get('recv_speed', 'N/A')}\n")
-                f.write(f"Retransmits: {result.get('retransmits', 'N/A')}\n")
+        parts: List[str] = []
+        parts.append(f"Sysbench Performance Test Report (Simplified)\n")
+        parts.append(f"Test Time: {self.timestamp}\n")
+        parts.append("=" * 50 + "\n\n")
+
+        # System Information
+        parts.append("System Information\n")
+        parts.append("-" * 30 + "\n")
+        system_info = self.results["system_info"]
+        if system_info:
+            for key in SYSINFO_KEYS:
+                if key in system_info:
+                    parts.append(f"{key}: {system_info[key]}\n")
+        else:
+            parts.append("System information not available\n")
+        parts.append("\n")
+
+        benchmark_results = self.results["benchmark_results"]
+
+        # CPU test results
+        for test_name in ["cpu_single_thread", "cpu_multi_thread"]:
+            rec = benchmark_results.get(test_name)
+            if rec and rec.status == "success":
+                result = rec.parsed
+                parts.append(f"\nCPU Test - {'Single Thread' if 'single' in test_name else 'Multi Thread'}\n")
+                parts.append("-" * 30 + "\n")
+                parts.append(f"Test Threads: {result['threads']}\n")
+                parts.append(f"Test Duration: {result['time']}\n")
+                parts.append(f"CPU Speed: {result['events_per_second']} events/sec\n")
+                parts.append(f"Completed At: {self._format_timestamp(rec.timestamp_ns)}\n")
+
+        # Memory test results
+        rec = benchmark_results.get("memory")
+        if rec and rec.status == "success":
+            result = rec.parsed
+            parts.append(f"\nMemory Test\n")
+            parts.append("-" * 30 + "\n")
+            parts.append(f"Test Options: Block Size {result['block_size']}\n")
+            parts.append(f"Transfer Speed: {result['transfer_speed']}\n")
+            parts.append(f"Total Latency: {result['latency_sum']}\n")
+            parts.append(f"Completed At: {self._format_timestamp(rec.timestamp_ns)}\n")
+
+        # File I/O test results
+        for test_name in ["fileio_rndrw", "fileio_seqrd"]:
+            rec = benchmark_results.get(test_name)
+            if rec and rec.status == "success":
+                result = rec.parsed
+                parts.append(f"\nDisk Test - {'Random Read/Write' if 'rndrw' in test_name else 'Sequential Read'}\n")
+                parts.append("-" * 30 + "\n")
+                parts.append(f"Read Speed: {result['read_throughput']} MiB/s\n")
+                if result["write_throughput"]:
+                    parts.append(f"Write Speed: {result['write_throughput']} MiB/s\n")
+                parts.append(f"Total Latency: {result['latency_sum']} ms\n")
+                parts.append(f"Completed At: {self._format_timestamp(rec.timestamp_ns)}\n")
+
+        # Network test results
+        rec = benchmark_results.get("network")
+        if rec and rec.status == "success":
+            result = rec.parsed
+            parts.append(f"\nNetwork Test\n")
+            parts.append("-" * 30 + "\n")
+            parts.append(f"Send Speed: {result.get('send_speed', 'N/A')}\n")
+            parts.append(f"Receive Speed: {result.get('recv_speed', 'N/A')}\n")
+            parts.append(f"Retransmits: {result.get('retransmits', 'N/A')}\n")
+            parts.append(f"Completed At: {self._format_timestamp(rec.timestamp_ns)}\n")
+
+        self._report_path.write_text("".join(parts))
 
         logger.info("Test completed!")
-        logger.info(f"Results saved to: {self.result_dir}/")
-        logger.info(f"- Raw data: {json_path}")
-        logger.info(f"- Summary report: {report_path}")
+        logger.info("Results saved to: %s/", self.result_dir)
+        logger.info("- Raw data: %s", self._json_path)
+        logger.info("- Summary report: %s", self._report_path)
 
 
 def main():